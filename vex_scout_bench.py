@@ -0,0 +1,866 @@
+"""
+================================================================================
+ VEX SCOUT - BENCHMARK SUITE
+================================================================================
+
+ WHAT THIS PROGRAM DOES:
+ -----------------------
+ Measures how fast (and how memory-hungry) the analysis pipeline in
+ vex_scout_v6.py is, without touching the real RobotEvents API.
+
+ 1. SYNTHETIC EVENTS: Builds realistic fake RobotEvents data at several sizes:
+      local     -  40 teams, 1 division
+      signature -  80 teams, 1 division
+      worlds    - 800 teams, 10 divisions
+    Every event has qualification matches (including some ties), a full
+    elimination bracket, and driver + programming skills runs.
+
+ 2. FAKE API: Serves that data from a small local web server that speaks the
+    same URLs, paging and JSON shapes as RobotEvents.
+
+ 3. PIPELINE BENCHMARK: Runs analyze_event end to end, and then every stage
+    on its own, against the fake API. Reports wall-clock time and peak
+    memory for each stage and size.
+
+ 4. MODEL BENCHMARK: Trains the shipped model and cheaper alternatives on
+    the same data and reports training time, file size, load time,
+    prediction latency and holdout accuracy/AUC.
+
+ HOW TO RUN:
+ -----------
+    python vex_scout_bench.py                       # all sizes
+    python vex_scout_bench.py --sizes local worlds  # just some sizes
+    python vex_scout_bench.py --json results.json   # save results
+    python vex_scout_bench.py --baseline results.json
+        # compare against saved results; exits with code 1 if any stage got
+        # more than --tolerance (default 25%) slower
+
+    python vex_scout_bench.py model                 # uses training_data/
+    python vex_scout_bench.py model --synthetic 60  # generated dataset
+
+================================================================================
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import warnings
+import shutil
+import argparse
+import tempfile
+import threading
+import tracemalloc
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+import vex_scout_v6 as vex
+
+
+# =============================================================================
+# SYNTHETIC EVENT GENERATOR
+# =============================================================================
+# The numbers below are tuned to look like a real Push Back season:
+# alliance scores mostly land between 30 and 110, autos are worth a few
+# points, and about 2% of matches end in a tie.
+# =============================================================================
+
+EVENT_SIZES = {
+    'local':     {'teams': 40,  'divisions': 1,  'matches_per_team': 8},
+    'signature': {'teams': 80,  'divisions': 1,  'matches_per_team': 10},
+    'worlds':    {'teams': 800, 'divisions': 10, 'matches_per_team': 10},
+}
+
+TIE_CHANCE = 0.02        # Fraction of matches forced to a tie
+NO_SKILLS_CHANCE = 0.15  # Fraction of teams that never ran skills
+
+
+def make_team(rnd, team_id):
+    """Creates one fake team with a hidden 'true' strength"""
+    number = rnd.randint(100, 99999)
+    return {
+        'id': team_id,
+        'name': f"{number}{rnd.choice('ABCDXYZ')}",
+        'strength': rnd.gauss(22, 7),     # Points this robot adds per match
+        'auto': rnd.uniform(0, 1)         # Chance of winning the auto bonus
+    }
+
+
+def alliance_score(rnd, teams):
+    """Scores one alliance: sum of robot strengths plus match-to-match noise"""
+    return max(0, int(round(sum(t['strength'] for t in teams) + rnd.gauss(0, 10))))
+
+
+def team_ref(team):
+    """The {id, name} team object RobotEvents embeds in matches/rankings"""
+    return {'id': team['id'], 'name': team['name']}
+
+
+def make_match(match_id, division, name, round_num, instance, matchnum,
+               red, blue, red_score, blue_score, scored=True):
+    """Builds one match object in the RobotEvents v2 format"""
+    return {
+        'id': match_id,
+        'event': {'id': 0},
+        'division': {'id': division['id'], 'name': division['name']},
+        'round': round_num,            # 2 = qualification, 3+ = elims
+        'instance': instance,
+        'matchnum': matchnum,
+        'name': name,
+        'scored': scored,
+        'scheduled': None,
+        'started': None,
+        'field': 'Field 1',
+        'alliances': [
+            {'color': 'red', 'score': red_score,
+             'teams': [{'team': team_ref(t), 'sitting': False} for t in red]},
+            {'color': 'blue', 'score': blue_score,
+             'teams': [{'team': team_ref(t), 'sitting': False} for t in blue]},
+        ]
+    }
+
+
+def generate_division(rnd, division, teams, matches_per_team, first_match_id, unplayed=0):
+    """
+    Generates one division's qualification schedule, rankings and elims.
+
+    Parameters:
+        rnd (random.Random): Seeded random generator
+        division (dict): {id, name}
+        teams (list): Teams in this division
+        matches_per_team (int): Qualification matches each team plays
+        first_match_id (int): First match ID to use (IDs are unique per event)
+        unplayed (int): How many of the LAST qualification matches are
+                        scheduled but not played yet
+
+    Returns:
+        tuple: (rankings, matches, champions) - champions is the winning
+               alliance's teams (empty until elims are played)
+    """
+    record = {t['id']: {'wins': 0, 'losses': 0, 'ties': 0, 'wp': 0, 'ap': 0, 'sp': 0}
+              for t in teams}
+    matches = []
+    match_id = first_match_id
+
+    # QUALIFICATIONS: shuffle everyone into groups of 4 each round
+    n_quals = len(teams) * matches_per_team // 4
+    order = []
+    for q in range(n_quals):
+        if len(order) < 4:
+            refill = teams[:]
+            rnd.shuffle(refill)
+            order.extend(refill)
+        four, order = order[:4], order[4:]
+        red, blue = four[:2], four[2:]
+
+        played = q < n_quals - unplayed
+        if not played:
+            matches.append(make_match(match_id, division, f"Qualifier #{q + 1}", 2, 1, q + 1,
+                                      red, blue, 0, 0, scored=False))
+            match_id += 1
+            continue
+
+        red_score = alliance_score(rnd, red)
+        blue_score = red_score if rnd.random() < TIE_CHANCE else alliance_score(rnd, blue)
+
+        # Autonomous bonus goes to whichever alliance has the better auto
+        red_auto = sum(t['auto'] for t in red) + rnd.gauss(0, 0.3)
+        blue_auto = sum(t['auto'] for t in blue) + rnd.gauss(0, 0.3)
+
+        for side, my_score, opp_score, won_auto in [
+            (red, red_score, blue_score, red_auto > blue_auto),
+            (blue, blue_score, red_score, blue_auto >= red_auto)
+        ]:
+            for t in side:
+                r = record[t['id']]
+                if my_score > opp_score:
+                    r['wins'] += 1
+                    r['wp'] += 2
+                elif my_score < opp_score:
+                    r['losses'] += 1
+                else:
+                    r['ties'] += 1
+                    r['wp'] += 1
+                r['ap'] += 4 if won_auto else 0
+                r['sp'] += min(my_score, opp_score)   # Strength of schedule
+
+        matches.append(make_match(match_id, division, f"Qualifier #{q + 1}", 2, 1, q + 1,
+                                  red, blue, red_score, blue_score))
+        match_id += 1
+
+    # RANKINGS: WP, then AP, then SP (the official tiebreakers)
+    ranked = sorted(teams, key=lambda t: (-record[t['id']]['wp'],
+                                          -record[t['id']]['ap'],
+                                          -record[t['id']]['sp']))
+    rankings = []
+    for rank, t in enumerate(ranked, start=1):
+        r = record[t['id']]
+        rankings.append({
+            'id': 100000 + t['id'],
+            'event': {'id': 0},
+            'division': {'id': division['id'], 'name': division['name']},
+            'rank': rank,
+            'team': team_ref(t),
+            'wins': r['wins'], 'losses': r['losses'], 'ties': r['ties'],
+            'wp': r['wp'], 'ap': r['ap'], 'sp': r['sp'],
+            'high_score': 0,
+            'average_points': 0,
+            'total_points': 0
+        })
+
+    if unplayed:
+        return rankings, matches, []   # Elims haven't started yet
+
+    # ELIMINATIONS: 16 alliances (seed i picks seed 33-i), single elimination
+    alliances = []
+    for seed in range(min(16, len(ranked) // 2)):
+        alliances.append([ranked[seed], ranked[min(len(ranked) - 1, 31 - seed)]])
+
+    for round_num, label in [(6, 'R16'), (3, 'QF'), (4, 'SF'), (5, 'Final')]:
+        if len(alliances) < 2:
+            break
+        survivors = []
+        for i in range(len(alliances) // 2):
+            red, blue = alliances[i], alliances[-(i + 1)]
+            red_score = alliance_score(rnd, red)
+            blue_score = alliance_score(rnd, blue)
+            if red_score == blue_score:
+                red_score += 1   # Elims replay ties; keep the bracket simple
+            matches.append(make_match(match_id, division, f"{label} #{i + 1}-1", round_num, i + 1, 1,
+                                      red, blue, red_score, blue_score))
+            match_id += 1
+            survivors.append(red if red_score > blue_score else blue)
+        alliances = survivors
+
+    return rankings, matches, alliances[0] if len(alliances) == 1 else []
+
+
+def generate_event(size='local', seed=42, unplayed=0):
+    """
+    Generates a complete fake event.
+
+    Parameters:
+        size (str): Key of EVENT_SIZES
+        seed (int): Random seed (same seed = same event)
+        unplayed (int): Unplayed qualification matches per division
+
+    Returns:
+        dict: {event, rankings, matches, skills, awards} in RobotEvents format
+    """
+    spec = EVENT_SIZES[size]
+    rnd = random.Random(seed)
+
+    teams = [make_team(rnd, 1000 + i) for i in range(spec['teams'])]
+    # Make team names unique (random numbers can collide)
+    seen = set()
+    for t in teams:
+        while t['name'] in seen:
+            t['name'] = f"{rnd.randint(100, 99999)}{rnd.choice('ABCDXYZ')}"
+        seen.add(t['name'])
+
+    divisions = [{'id': i + 1, 'name': f"Division {i + 1}", 'order': i + 1}
+                 for i in range(spec['divisions'])]
+    sku = f"RE-BENCH-{size.upper()}-{seed}"
+    event = {
+        'id': 90000 + seed * len(EVENT_SIZES) + list(EVENT_SIZES).index(size),
+        'sku': sku,
+        'name': f"Benchmark {size.title()} Event",
+        'divisions': divisions
+    }
+
+    rankings, matches, awards = {}, {}, []
+    per_division = len(teams) // len(divisions)
+    for i, division in enumerate(divisions):
+        div_teams = teams[i * per_division:(i + 1) * per_division]
+        div_rankings, div_matches, champions = generate_division(
+            rnd, division, div_teams, spec['matches_per_team'],
+            first_match_id=1 + i * 10000, unplayed=unplayed
+        )
+        rankings[division['id']] = div_rankings
+        matches[division['id']] = div_matches
+        if champions:
+            awards.append({
+                'id': len(awards) + 1,
+                'title': f"Tournament Champions ({division['name']})",
+                'teamWinners': [{'team': team_ref(t)} for t in champions]
+            })
+
+    # SKILLS: driver and programming runs (some teams never ran skills)
+    skills = []
+    for t in teams:
+        if rnd.random() < NO_SKILLS_CHANCE:
+            continue
+        for skill_type, scale in [('driver', 3.0), ('programming', 2.0)]:
+            skills.append({
+                'id': len(skills) + 1,
+                'event': {'id': event['id']},
+                'team': team_ref(t),
+                'type': skill_type,
+                'rank': 0,
+                'score': max(0, int(t['strength'] * scale + rnd.gauss(0, 8))),
+                'attempts': rnd.randint(1, 3)
+            })
+
+    return {'event': event, 'rankings': rankings, 'matches': matches,
+            'skills': skills, 'awards': awards}
+
+
+# =============================================================================
+# FAKE ROBOTEVENTS API
+# =============================================================================
+# A tiny local web server answering the same URLs analyze_event uses:
+#   /events?sku=...
+#   /events/{id}/divisions/{div}/rankings?page=&per_page=
+#   /events/{id}/divisions/{div}/matches?page=&per_page=
+#   /events/{id}/skills?page=&per_page=
+#   /events/{id}/awards?page=&per_page=
+# =============================================================================
+
+class FakeRobotEvents:
+    """Serves one or more generated events over HTTP on localhost"""
+    def __init__(self, events):
+        self.events = {e['event']['sku']: e for e in events}
+        self.by_id = {e['event']['id']: e for e in events}
+        self.requests = 0
+
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                fake.requests += 1
+                status, body = fake.route(self.path)
+                data = json.dumps(body).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass   # Keep benchmark output clean
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+        return False
+
+    @staticmethod
+    def page(items, query):
+        """Slices a list into one RobotEvents-style page"""
+        page = int(query.get('page', ['1'])[0])
+        per_page = int(query.get('per_page', ['25'])[0])
+        last_page = max(1, (len(items) + per_page - 1) // per_page)
+        return {
+            'meta': {'current_page': page, 'last_page': last_page,
+                     'per_page': per_page, 'total': len(items)},
+            'data': items[(page - 1) * per_page:page * per_page]
+        }
+
+    def route(self, raw_path):
+        """Returns (status, JSON body) for one request path"""
+        url = urlparse(raw_path)
+        query = parse_qs(url.query)
+        parts = [p for p in url.path.split('/') if p]
+
+        if parts == ['events'] and 'sku' in query:
+            found = self.events.get(query['sku'][0])
+            return 200, {'meta': {'total': 1 if found else 0},
+                         'data': [found['event']] if found else []}
+
+        if len(parts) >= 3 and parts[0] == 'events' and parts[1].isdigit():
+            event = self.by_id.get(int(parts[1]))
+            if not event:
+                return 404, {'message': 'Not found'}
+            if parts[2] == 'skills':
+                return 200, self.page(event['skills'], query)
+            if parts[2] == 'awards':
+                return 200, self.page(event['awards'], query)
+            if parts[2] == 'divisions' and len(parts) == 5:
+                division_id = int(parts[3])
+                if parts[4] == 'rankings':
+                    return 200, self.page(event['rankings'].get(division_id, []), query)
+                if parts[4] == 'matches':
+                    return 200, self.page(event['matches'].get(division_id, []), query)
+
+        return 404, {'message': 'Not found'}
+
+
+# =============================================================================
+# BENCHMARK HARNESS
+# =============================================================================
+
+def measure(func, *args):
+    """
+    Runs func(*args) once, timing it and tracking its memory.
+
+    Returns:
+        tuple: (return value, seconds, peak bytes allocated during the call,
+                bytes still allocated afterwards)
+    """
+    tracemalloc.reset_peak()
+    before = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    value = func(*args)
+    seconds = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    return value, seconds, max(0, peak - before), current - before
+
+
+def load_model():
+    """Loads the trained model once (benchmarks shouldn't time disk loads)"""
+    if not os.path.exists(vex.MODEL_FILE):
+        print(f"⚠️ {vex.MODEL_FILE} not found - ML stage runs with the neutral fallback")
+        return None
+    return vex.joblib.load(vex.MODEL_FILE)['model']
+
+
+def bench_stages(sku, model, my_team):
+    """
+    Runs every stage of the pipeline on its own, in pipeline order.
+
+    Returns:
+        dict: {stage: {'seconds', 'peak_bytes', 'retained_bytes'}}
+    """
+    headers = {"Authorization": "Bearer benchmark"}
+    results = {}
+
+    def record(stage, func, *args):
+        value, seconds, peak, retained = measure(func, *args)
+        results[stage] = {'seconds': seconds, 'peak_bytes': peak, 'retained_bytes': retained}
+        return value
+
+    event = record('fetch_event', vex.fetch_event_info, sku, headers)
+    rankings = record('fetch_rankings', vex.fetch_rankings, event, headers)
+    matches = record('fetch_matches', vex.fetch_matches, event, headers)
+    skills = record('fetch_skills', vex.fetch_skills, event, headers)
+
+    stats, trueskill = record('build_team_stats', vex.build_team_stats, rankings)
+    table = record('process_matches', vex.process_matches, matches, stats, trueskill)
+    opr = record('calculate_opr', vex.calculate_opr, table, stats)
+    record('apply_skills', vex.apply_skills, skills, stats)
+    processed = record('process_teams', vex.process_teams, stats, table, trueskill, opr, model, [])
+    my_stats, who_wants = record('calculate_recommendations', vex.calculate_recommendations, processed, my_team)
+    record('build_outputs', vex.build_outputs, event['name'], [processed], my_stats, who_wants, model, [])
+    return results
+
+
+def bench_size(size, model, repeat):
+    """
+    Benchmarks one event size: end to end, then stage by stage.
+
+    Returns:
+        dict: {'teams', 'matches', 'end_to_end': {...}, 'stages': {...}}
+    """
+    data = generate_event(size)
+    sku = data['event']['sku']
+    n_matches = sum(len(m) for m in data['matches'].values())
+    my_team = data['rankings'][1][len(data['rankings'][1]) // 3]['team']['name']
+
+    with FakeRobotEvents([data]) as fake:
+        vex.API_BASE = fake.url
+        vex.response_cache.clear()
+        vex.loaded_model = model
+
+        # End to end (best of `repeat` runs - the first warms imports/caches)
+        best = None
+        for _ in range(repeat):
+            vex.clear_prediction_cache()   # Measure a first analysis, not a refresh
+            # The app's stage timers reset tracemalloc's peak as they go, so
+            # the whole-run peak comes from the app's own memory metrics
+            result, seconds, _, _ = measure(vex.analyze_event, sku, 'benchmark', my_team, True)
+            memory = result['metrics']['memory']
+            if best is None or seconds < best['seconds']:
+                best = {'seconds': seconds, 'peak_bytes': memory['peakBytes'],
+                        'stages': result['metrics']['stages'],
+                        'memory': memory['stages'],
+                        'structures': memory['structures']}
+
+        # A refresh with nothing changed (predictions come from the cache)
+        _, refresh_seconds, _, _ = measure(vex.analyze_event, sku, 'benchmark', my_team)
+
+        # Each stage on its own (best of `repeat` runs per stage)
+        stages = {}
+        for _ in range(repeat):
+            vex.clear_prediction_cache()
+            for stage, numbers in bench_stages(sku, model, my_team).items():
+                if stage not in stages or numbers['seconds'] < stages[stage]['seconds']:
+                    stages[stage] = numbers
+
+    return {
+        'teams': EVENT_SIZES[size]['teams'],
+        'matches': n_matches,
+        'end_to_end': best,
+        'refresh_seconds': refresh_seconds,
+        'stages': stages
+    }
+
+
+def print_report(results):
+    """Prints a readable table of every size and stage"""
+    for size, r in results.items():
+        e2e = r['end_to_end']
+        print(f"\n📊 {size}: {r['teams']} teams, {r['matches']} matches")
+        print(f"   analyze_event end to end: {e2e['seconds'] * 1000:9.1f} ms"
+              f"   peak {e2e['peak_bytes'] / 1e6:8.2f} MB")
+        print(f"   unchanged refresh:        {r['refresh_seconds'] * 1000:9.1f} ms")
+        print(f"   {'stage':<28}{'time (ms)':>12}{'peak (MB)':>12}{'kept (MB)':>12}")
+        for stage, numbers in r['stages'].items():
+            print(f"   {stage:<28}{numbers['seconds'] * 1000:12.2f}{numbers['peak_bytes'] / 1e6:12.2f}"
+                  f"{numbers['retained_bytes'] / 1e6:12.2f}")
+        print(f"   {'structure':<28}{'size (MB)':>12}")
+        for name, size in sorted(e2e['structures'].items(), key=lambda item: -item[1]):
+            print(f"   {name:<28}{size / 1e6:12.2f}")
+
+
+def compare_to_baseline(results, baseline, tolerance):
+    """
+    Flags stages that got slower than the saved baseline.
+
+    Parameters:
+        results (dict): This run's results
+        baseline (dict): Results saved by an earlier --json run
+        tolerance (float): Allowed slowdown (0.25 = 25%)
+
+    Returns:
+        list: Human-readable regression descriptions (empty = all good)
+    """
+    regressions = []
+    for size, r in results.items():
+        old = baseline.get(size)
+        if not old:
+            continue
+        pairs = [('end_to_end', r['end_to_end'], old['end_to_end'])]
+        pairs += [(stage, r['stages'][stage], old['stages'][stage])
+                  for stage in r['stages'] if stage in old['stages']]
+        for stage, new_numbers, old_numbers in pairs:
+            # Ignore sub-millisecond stages - timer noise dominates
+            if old_numbers['seconds'] < 0.001:
+                continue
+            slowdown = new_numbers['seconds'] / old_numbers['seconds'] - 1
+            if slowdown > tolerance:
+                regressions.append(
+                    f"{size}/{stage}: {old_numbers['seconds'] * 1000:.1f} ms -> "
+                    f"{new_numbers['seconds'] * 1000:.1f} ms (+{slowdown:.0%})"
+                )
+    return regressions
+
+
+# =============================================================================
+# MODEL BENCHMARK
+# =============================================================================
+# Compares the shipped model (vex.build_classifier) with cheaper options on
+# the same recorded dataset:
+#   - training time and saved file size
+#   - load time (what the app pays at startup)
+#   - per-row latency (the app predicts one team at a time) and batch latency
+#   - holdout accuracy and AUC (how well it ranks successful teams)
+# Random forests are also measured compiled to NumPy arrays, the way the app
+# loads them.
+#
+# The dataset is the app's training store (training_data/). With
+# --synthetic N, N generated events are run through the app's own
+# collect_training_rows (against the fake API) instead.
+# =============================================================================
+
+LATENCY_ROWS = 200   # Single-row predictions timed per model
+
+
+def model_candidates():
+    """
+    The models to compare.
+    
+    Returns:
+        dict: {name: function that builds an untrained model}
+    """
+    from sklearn.ensemble import RandomForestClassifier, HistGradientBoostingClassifier
+    
+    def forest(trees, depth):
+        return lambda: RandomForestClassifier(
+            n_estimators=trees, max_depth=depth,
+            class_weight='balanced', random_state=42
+        )
+    
+    return {
+        'configured (rf 200x12)': vex.build_classifier,
+        'rf 100 trees': forest(100, 12),
+        'rf 50 trees': forest(50, 12),
+        'rf depth 8': forest(200, 8),
+        'rf depth 6': forest(200, 6),
+        'rf 50 trees, depth 8': forest(50, 8),
+        'hist gradient boosting': lambda: HistGradientBoostingClassifier(
+            max_iter=200, class_weight='balanced', random_state=42
+        ),
+    }
+
+
+def record_dataset(n_events, path=None):
+    """
+    Builds a training set from generated events using the app's own
+    collect_training_rows, so features match real training exactly.
+
+    The label (Tournament Champions) comes straight from each generated
+    bracket, so the elim matches are left out of what the fake API serves:
+    with them, Elim_Win_Rate gives the answer away and every model scores
+    1.000. Features are built from the quals only.
+    
+    Parameters:
+        n_events (int): Events to generate (alternating local / signature)
+        path (str): Also save the rows here as CSV (optional)
+    
+    Returns:
+        DataFrame: One row per team
+    """
+    events = [generate_event('local' if i % 2 == 0 else 'signature', seed=i + 1)
+              for i in range(n_events)]
+    for data in events:
+        data['matches'] = {
+            division_id: [m for m in div_matches if not vex.is_elim_match(m['name'])[0]]
+            for division_id, div_matches in data['matches'].items()
+        }
+    headers = {"Authorization": "Bearer benchmark"}
+    
+    rows = []
+    with FakeRobotEvents(events) as fake:
+        vex.API_BASE = fake.url
+        for data in events:
+            rows.extend(vex.collect_training_rows(data['event']['sku'], headers))
+    
+    df = vex.pd.DataFrame(rows).fillna(0)
+    if path:
+        df.to_csv(path, index=False)
+        print(f"💾 Recorded {len(df)} examples to {path}")
+    return df
+
+
+def score_model(model, test, load, size, train_seconds):
+    """
+    Times and scores one trained model.
+
+    Parameters:
+        model: Anything with predict_proba (sklearn model or CompiledForest)
+        test (DataFrame): Holdout rows
+        load (function): Loads the saved model from disk (timed)
+        size (int): Saved size in bytes
+        train_seconds (float): How long fitting took
+
+    Returns:
+        dict: Timings (seconds), file size (bytes) and holdout scores
+    """
+    from sklearn.metrics import accuracy_score, roc_auc_score
+
+    features = vex.MODEL_FEATURES
+    load_seconds = min(measure(load)[1] for _ in range(3))
+
+    # One row at a time, in the same list-of-lists shape process_teams uses
+    rows = test[features].values.tolist()[:LATENCY_ROWS]
+    latencies = []
+    for row in rows:
+        start = time.perf_counter()
+        model.predict_proba([row])
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+
+    start = time.perf_counter()
+    proba = model.predict_proba(test[features].values)[:, 1]
+    batch_seconds = time.perf_counter() - start
+
+    y = test['Was_Successful']
+    return {
+        'train_seconds': train_seconds,
+        'file_bytes': size,
+        'load_seconds': load_seconds,
+        'row_seconds_median': latencies[len(latencies) // 2],
+        'row_seconds_p95': latencies[int(len(latencies) * 0.95)],
+        'batch_seconds_per_row': batch_seconds / len(test),
+        'accuracy': accuracy_score(y, proba >= 0.5),
+        'auc': roc_auc_score(y, proba) if y.nunique() == 2 else None,
+    }
+
+
+def bench_model(name, factory, train, test, workdir):
+    """
+    Trains, saves, loads and scores one model - and, for random forests,
+    the same model compiled to NumPy arrays (see COMPILED FOREST in the app).
+
+    Returns:
+        dict: {name: scores} (plus {name + ' [compiled]': scores} for forests)
+    """
+    features = vex.MODEL_FEATURES
+    model = factory()
+    start = time.perf_counter()
+    vex.fit_classifier(model, train[features], train['Was_Successful'])
+    train_seconds = time.perf_counter() - start
+
+    # Save the same way train_model does
+    path = os.path.join(workdir, 'model.pkl')
+    vex.joblib.dump({'model': model, 'features': features}, path)
+    results = {name: score_model(model, test, lambda: vex.joblib.load(path),
+                                 os.path.getsize(path), train_seconds)}
+
+    try:
+        forest = vex.CompiledForest.from_sklearn(model, features, 0)
+    except ValueError:
+        return results   # Not a forest
+    folder = os.path.join(workdir, 'forest')
+    forest.save(folder)
+    size = sum(os.path.getsize(os.path.join(folder, f)) for f in os.listdir(folder))
+    compiled = vex.CompiledForest.load(folder)
+    results[name + ' [compiled]'] = score_model(
+        compiled, test, lambda: vex.CompiledForest.load(folder), size, train_seconds
+    )
+    return results
+
+
+def print_model_report(results, n_train, n_test):
+    """Prints the model comparison table"""
+    print(f"\n🧠 Models ({n_train} training rows, {n_test} holdout rows)")
+    print(f"   {'model':<37}{'train s':>9}{'size MB':>9}{'load ms':>9}"
+          f"{'row µs':>9}{'p95 µs':>9}{'batch µs':>9}{'acc':>7}{'auc':>7}")
+    for name, r in results.items():
+        auc = f"{r['auc']:.3f}" if r['auc'] is not None else '  n/a'
+        print(f"   {name:<37}{r['train_seconds']:9.2f}{r['file_bytes'] / 1e6:9.2f}"
+              f"{r['load_seconds'] * 1000:9.1f}{r['row_seconds_median'] * 1e6:9.0f}"
+              f"{r['row_seconds_p95'] * 1e6:9.0f}{r['batch_seconds_per_row'] * 1e6:9.1f}"
+              f"{r['accuracy']:7.3f}{auc:>7}")
+
+
+# =============================================================================
+# COMMAND LINE
+# =============================================================================
+
+def run_pipeline_bench(args):
+    """`pipeline` command: time analyze_event on each event size"""
+    # Benchmarks measure OUR code, so: no request spacing, no snapshot reuse,
+    # and all files (database, snapshots) go to a throwaway folder.
+    vex.MODEL_FILE = os.path.abspath(vex.MODEL_FILE)
+    model = load_model()
+    vex.model_state.update({'status': 'ready', 'ready': True})
+
+    workdir = tempfile.mkdtemp(prefix='vex_bench_')
+    old_cwd = os.getcwd()
+    os.chdir(workdir)
+    tracemalloc.start()
+    results = {}
+    try:
+        for size in args.sizes:
+            print(f"⏱️ Benchmarking {size}...")
+            results[size] = bench_size(size, model, args.repeat)
+    finally:
+        tracemalloc.stop()
+        os.chdir(old_cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print_report(results)
+    return results
+
+
+def run_model_bench(args):
+    """`model` command: compare models on a recorded dataset"""
+    from sklearn.model_selection import train_test_split
+
+    if args.synthetic:
+        df = record_dataset(args.synthetic, args.record)
+    elif os.path.isdir(args.data):
+        df = vex.load_training_store(args.data).fillna(0)
+    elif os.path.exists(args.data):
+        df = vex.pd.read_csv(args.data)
+    else:
+        df = None
+    if df is None or df.empty:
+        print(f"❌ No training data in {args.data}. Train the model once (it stores the data) "
+              f"or use --synthetic N")
+        sys.exit(2)
+
+    # Stratify so the rare "successful" teams land on both sides
+    labels = df['Was_Successful']
+    train, test = train_test_split(
+        df, test_size=0.25, random_state=42,
+        stratify=labels if labels.value_counts().min() >= 2 else None
+    )
+
+    workdir = tempfile.mkdtemp(prefix='vex_bench_')
+    results = {}
+    try:
+        for name, factory in model_candidates().items():
+            if args.models and name not in args.models:
+                continue
+            print(f"⏱️ {name}...")
+            results.update(bench_model(name, factory, train, test, workdir))
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print_model_report(results, len(train), len(test))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark VEX Scout')
+    shared = argparse.ArgumentParser(add_help=False)
+    shared.add_argument('--json', help='Save results to this file')
+    commands = parser.add_subparsers(dest='command')
+
+    pipeline = commands.add_parser('pipeline', parents=[shared],
+                                   help='Time the analysis pipeline (default)')
+    pipeline.add_argument('--sizes', nargs='+', choices=list(EVENT_SIZES), default=list(EVENT_SIZES))
+    pipeline.add_argument('--repeat', type=int, default=3, help='Runs per measurement (best is kept)')
+    pipeline.add_argument('--baseline', help='Compare against results saved with --json')
+    pipeline.add_argument('--tolerance', type=float, default=0.25,
+                          help='Allowed slowdown vs baseline before failing (default 0.25)')
+
+    model = commands.add_parser('model', parents=[shared],
+                                help='Compare ML models for speed and accuracy')
+    model.add_argument('--data', default=vex.TRAINING_STORE_DIR,
+                       help='Training store folder, or a CSV saved with --record')
+    model.add_argument('--synthetic', type=int, metavar='N',
+                       help='Build the dataset from N generated events instead')
+    model.add_argument('--record', help='With --synthetic, also save the dataset here')
+    model.add_argument('--models', nargs='+', help='Only these candidates (default: all)')
+    model.add_argument('--workers', type=int, default=vex.TRAINING_WORKERS,
+                       help=f'Cores used for fitting (default {vex.TRAINING_WORKERS})')
+
+    # No command = pipeline (keeps `python vex_scout_bench.py --sizes local` working)
+    argv = sys.argv[1:]
+    if not argv or argv[0] not in ('pipeline', 'model', '-h', '--help'):
+        argv = ['pipeline'] + argv
+    args = parser.parse_args(argv)
+
+    # The app predicts from plain lists, like these benchmarks - not a problem
+    warnings.filterwarnings('ignore', message='X does not have valid feature names')
+    # Both commands talk to the fake API only
+    vex.REQUEST_DELAY = 0
+    vex.SNAPSHOTS_ENABLED = False
+
+    if args.command == 'model':
+        vex.TRAINING_WORKERS = args.workers
+        results = run_model_bench(args)
+    else:
+        results = run_pipeline_bench(args)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n💾 Saved results to {args.json}")
+
+    if getattr(args, 'baseline', None):
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(results, baseline, args.tolerance)
+        if regressions:
+            print("\n❌ Slower than baseline:")
+            for line in regressions:
+                print(f"   {line}")
+            sys.exit(1)
+        print("\n✅ No regressions against baseline")
+
+
+if __name__ == '__main__':
+    main()